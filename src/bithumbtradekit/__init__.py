@@ -12,11 +12,12 @@ __email__ = "infinist7@naver.com"
 from .client import BithumbClient
 from .market import MarketData
 from .trading import Trading
-from .account import Account
+from .account import Account, AccountSnapshot
 
 __all__ = [
     "BithumbClient",
     "MarketData",
     "Trading",
     "Account",
+    "AccountSnapshot",
 ]
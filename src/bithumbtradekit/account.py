@@ -3,17 +3,44 @@
 """
 
 import logging
-import traceback
+import time
+from dataclasses import dataclass, field
 from typing import Dict, Any, List, Tuple, Optional
 from .client import BithumbClient
 
 
 logger = logging.getLogger(__name__)
 
+# 계좌 응답 TTL (초) - 한 틱 안의 잔고 조회들이 API 호출 1회를 공유
+_ACCOUNT_TTL = 1.0
+
+
+@dataclass(frozen=True)
+class AccountSnapshot:
+    """계좌 1회 조회로 만든 불변 뷰
+
+    Attributes:
+        krw: KRW 잔고
+        coins: 코인 심볼 -> (보유수량, 평균매수가)
+        assets: 잔고가 있는 자산 정보 리스트 (get_all_balances 형식)
+    """
+
+    krw: float = 0.0
+    coins: Dict[str, Tuple[float, float]] = field(default_factory=dict)
+    assets: List[Dict[str, Any]] = field(default_factory=list)
+
 
 class Account:
     """계좌 관리 클래스"""
 
+    __slots__ = (
+        "client",
+        "avg_buy_prices",
+        "_cache",
+        "_snapshot",
+        "_snapshot_src",
+    )
+
     def __init__(self, client: BithumbClient):
         """
         계좌 관리 클래스 초기화
@@ -23,25 +50,90 @@ class Account:
         """
         self.client = client
         self.avg_buy_prices = {}  # 평균매수가 저장용
+        self._cache = (0.0, None)  # (저장 시각, 계좌 응답)
+        self._snapshot = None  # 현재 캐시 응답으로 만든 AccountSnapshot
+        self._snapshot_src = None  # 스냅샷의 원본 응답 (동일성 비교용)
 
     def get_account_info(self) -> Dict[str, Any]:
         """
         빗썸 API를 사용하여 계좌 정보를 조회
 
+        응답은 짧은 TTL 동안 캐시되어, 같은 틱 안에서
+        잔고 조회 메서드들이 호출돼도 API는 1회만 호출됩니다.
+
         Returns:
             Dict[str, Any]: 계좌 정보
         """
+        now = time.monotonic()
+        ts, cached = self._cache
+        if cached is not None and now - ts < _ACCOUNT_TTL:
+            return cached
+
         try:
             response = self.client.get("/v1/accounts")
             if "error" in response:
                 logger.error(f"❌ API 호출 오류: {response['error']}")
                 return {"error": response["error"]}
+            self._cache = (now, response)
             return response
         except Exception as e:
-            logger.error(f"❗ 예외 발생: {e}")
-            traceback.print_exc()
+            logger.exception(f"❗ 예외 발생: {e}")
             return {"error": str(e)}
 
+    def snapshot(self, max_age: float = _ACCOUNT_TTL) -> Optional[AccountSnapshot]:
+        """
+        계좌를 1회만 조회하여 불변 뷰 생성
+
+        포트폴리오 K개 코인을 점검할 때 잔고 메서드를 K번 호출해도
+        API 호출은 1회로 끝납니다. 뷰는 원본 응답이 갱신될 때만
+        다시 만들어집니다.
+
+        Args:
+            max_age: 허용할 캐시 최대 수명 (초). 기본 TTL보다 짧으면
+                오래된 캐시를 버리고 다시 조회합니다.
+
+        Returns:
+            Optional[AccountSnapshot]: 계좌 뷰 (API 에러 시 None)
+        """
+        if max_age < _ACCOUNT_TTL and time.monotonic() - self._cache[0] >= max_age:
+            self._cache = (0.0, None)  # TTL보다 엄격한 요구 - 강제 재조회
+
+        account_info = self.get_account_info()
+        if "error" in account_info:
+            return None
+
+        # 같은 응답이면 이미 만든 뷰 재사용
+        if self._snapshot is not None and self._snapshot_src is account_info:
+            return self._snapshot
+
+        krw = 0.0
+        coins = {}
+        assets = []
+        # 자산 수만큼 도는 루프 - 전역 이름 조회를 줄이기 위해 로컬에 바인딩
+        _float = float
+        append = assets.append
+        for asset in account_info:
+            balance = _float(asset["balance"])
+            avg_price = _float(asset.get("avg_buy_price", 0) or 0)
+            currency = asset["currency"]
+            if currency == "KRW":
+                krw = balance
+            else:
+                coins[currency] = (balance, avg_price)
+            if balance > 0:
+                append(
+                    {
+                        "currency": currency,
+                        "balance": balance,
+                        "avg_buy_price": avg_price,
+                        "locked": _float(asset.get("locked", 0) or 0),
+                    }
+                )
+
+        self._snapshot = AccountSnapshot(krw=krw, coins=coins, assets=assets)
+        self._snapshot_src = account_info
+        return self._snapshot
+
     def get_krw_balance(self) -> float:
         """
         KRW 계좌 잔고 조회
@@ -50,16 +142,10 @@ class Account:
             float: KRW 잔고
         """
         try:
-            account_info = self.get_account_info()
-            if "error" in account_info:
-                logger.error(f"❌ 계좌 조회 실패: {account_info['error']}")
-                return 0
-
-            cash = [j["balance"] for j in account_info if j["currency"] == "KRW"]
-            return float(cash[0]) if cash else 0
+            snap = self.snapshot()
+            return snap.krw if snap else 0
         except Exception as e:
-            logger.error(f"❌ 계좌 조회 중 오류: {e}")
-            traceback.print_exc()
+            logger.exception(f"❌ 계좌 조회 중 오류: {e}")
             return 0
 
     def get_coin_balance(self, coin: str) -> Tuple[Optional[float], Optional[float]]:
@@ -75,15 +161,13 @@ class Account:
             - (0, 0): 해당 코인 미보유 시
         """
         try:
-            account_info = self.get_account_info()
-            if "error" in account_info:
-                logger.error(f"❌ 계좌 조회 실패: {account_info['error']}")
+            snap = self.snapshot()
+            if snap is None:
                 return None, None  # API 에러 시 None 반환으로 에러와 정상(0,0) 구분
 
-            coin_info = [j for j in account_info if j["currency"] == coin]
+            coin_info = snap.coins.get(coin)
             if coin_info:
-                balance = float(coin_info[0]["balance"])
-                avg_price = float(coin_info[0].get("avg_buy_price", 0))
+                balance, avg_price = coin_info
 
                 # API에서 평균매수가를 가져온 경우 저장
                 if avg_price > 0 and balance > 0:
@@ -96,8 +180,7 @@ class Account:
             else:
                 return 0, 0  # 해당 코인 보유하지 않음 (정상 상황)
         except Exception as e:
-            logger.error(f"❌ {coin} 잔고 조회 중 오류: {e}")
-            traceback.print_exc()
+            logger.exception(f"❌ {coin} 잔고 조회 중 오류: {e}")
             return None, None  # 예외 발생 시 None 반환
 
     def get_all_balances(self) -> List[Dict[str, Any]]:
@@ -107,20 +190,5 @@ class Account:
         Returns:
             List[Dict[str, Any]]: 모든 자산 정보 리스트
         """
-        account_info = self.get_account_info()
-        if "error" in account_info:
-            return []
-
-        balances = []
-        for asset in account_info:
-            if float(asset["balance"]) > 0:
-                balances.append(
-                    {
-                        "currency": asset["currency"],
-                        "balance": float(asset["balance"]),
-                        "avg_buy_price": float(asset.get("avg_buy_price", 0)),
-                        "locked": float(asset.get("locked", 0)),
-                    }
-                )
-
-        return balances
+        snap = self.snapshot()
+        return list(snap.assets) if snap else []
@@ -0,0 +1,297 @@
+"""
+비동기 API 클라이언트 모듈 (httpx 기반)
+
+동기 클라이언트는 코인 N개의 시세를 순차적으로 N번의 왕복으로 조회하지만,
+이 모듈의 비동기 클라이언트는 `asyncio.gather`로 동시에 요청하여
+전체 소요 시간을 왕복 1회 수준으로 줄입니다.
+
+사용하려면 `httpx` 가 필요합니다 (``pip install bithumbtradekit[async]``).
+"""
+
+import asyncio
+import hashlib
+import hmac
+import secrets
+import time
+from urllib.parse import urlencode
+from typing import Optional, Dict, Any, List
+import httpx
+from .client import _dumps, _encode_jwt, _loads
+
+
+_API_URL = "https://api.bithumb.com"
+_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+
+
+def _create_client() -> httpx.AsyncClient:
+    """HTTP/2 + 커넥션 풀이 적용된 AsyncClient 생성"""
+    return httpx.AsyncClient(http2=True, limits=_LIMITS, timeout=10.0)
+
+
+class AsyncBithumbClient:
+    """빗썸 API 비동기 클라이언트"""
+
+    __slots__ = ("access_key", "secret_key", "api_url", "_secret", "_hmac", "_client")
+
+    def __init__(self, access_key: str, secret_key: str):
+        """
+        빗썸 API 비동기 클라이언트 초기화
+
+        Args:
+            access_key: API 액세스 키
+            secret_key: API 시크릿 키
+        """
+        self.access_key = access_key
+        self.secret_key = secret_key
+        self.api_url = _API_URL
+        self._secret = (
+            secret_key.encode() if isinstance(secret_key, str) else secret_key
+        )
+        self._hmac = hmac.new(self._secret, digestmod=hashlib.sha256)
+        self._client = _create_client()
+
+    def _create_headers(
+        self, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, str]:
+        """JWT 인증 헤더 생성"""
+        payload = {
+            "access_key": self.access_key,
+            "nonce": secrets.token_hex(16),
+            "timestamp": round(time.time() * 1000),
+        }
+
+        if params:
+            query = urlencode(params).encode()
+            query_hash = hashlib.sha512(query).hexdigest()
+            payload.update(
+                {
+                    "query_hash": query_hash,
+                    "query_hash_alg": "SHA512",
+                }
+            )
+
+        jwt_token = _encode_jwt(self._hmac, payload)
+        return {"Authorization": f"Bearer {jwt_token}"}
+
+    async def get(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """GET 요청"""
+        headers = self._create_headers(params)
+        try:
+            response = await self._client.get(
+                self.api_url + endpoint, params=params, headers=headers
+            )
+            response.raise_for_status()
+            return _loads(response.content)
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def post(
+        self, endpoint: str, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """POST 요청"""
+        headers = self._create_headers(data)
+        # 동기 클라이언트와 동일하게 본문을 orjson으로 미리 직렬화
+        body = None
+        if data is not None:
+            body = _dumps(data)
+            headers["Content-Type"] = "application/json"
+        try:
+            response = await self._client.post(
+                self.api_url + endpoint, content=body, headers=headers
+            )
+            response.raise_for_status()
+            return _loads(response.content)
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def delete(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """DELETE 요청"""
+        headers = self._create_headers(params)
+        try:
+            response = await self._client.delete(
+                self.api_url + endpoint, params=params, headers=headers
+            )
+            response.raise_for_status()
+            return _loads(response.content)
+        except httpx.HTTPError as e:
+            return {"error": str(e)}
+
+    async def aclose(self) -> None:
+        """클라이언트 종료 (보유 중인 커넥션 반환)"""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncBithumbClient":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
+
+
+class AsyncTrading:
+    """거래 비동기 관리 클래스"""
+
+    __slots__ = ("client", "_semaphore")
+
+    # 거래소 레이트리밋을 고려한 동시 주문 상한
+    _MAX_CONCURRENCY = 10
+
+    def __init__(self, client: AsyncBithumbClient):
+        """
+        거래 비동기 관리 클래스 초기화
+
+        Args:
+            client: AsyncBithumbClient 인스턴스
+        """
+        self.client = client
+        # 3.8/3.9의 Semaphore는 생성 시점의 이벤트 루프에 묶이므로
+        # 실행 중인 루프 안(첫 _send_order)에서 지연 생성
+        self._semaphore: Optional[asyncio.Semaphore] = None
+
+    async def _send_order(
+        self,
+        market: str,
+        side: str,
+        volume: Optional[float] = None,
+        price: Optional[float] = None,
+        ord_type: str = "limit",
+    ) -> Dict[str, Any]:
+        """
+        주문 전송 공통 함수 (동기 Trading._send_order와 동일한 규칙)
+
+        Args:
+            market: 마켓 코드 (예: 'KRW-BTC')
+            side: 주문 종류 ('bid': 매수, 'ask': 매도)
+            volume: 주문 수량 (시장가 매수시 None)
+            price: 주문 가격 (시장가 매도시 None, 시장가 매수시 총 주문 금액)
+            ord_type: 주문 타입 ('limit': 지정가, 'market': 시장가 매도, 'price': 시장가 매수)
+
+        Returns:
+            Dict[str, Any]: 주문 결과
+
+        Raises:
+            ValueError: side/ord_type/market이 유효하지 않은 경우
+        """
+        from .trading import _TEMPLATES, _fmt, _validate_order
+
+        _validate_order(market, side, ord_type)
+        data = _TEMPLATES[(side, ord_type)].copy()
+        data["market"] = market
+
+        if ord_type == "limit":
+            if volume is not None:
+                data["volume"] = _fmt(volume)
+            if price is not None:
+                data["price"] = _fmt(price)
+        elif ord_type == "price":
+            if price is not None:
+                data["price"] = _fmt(price)
+        elif ord_type == "market":
+            if volume is not None:
+                data["volume"] = _fmt(volume)
+
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._MAX_CONCURRENCY)
+        async with self._semaphore:
+            return await self.client.post("/v1/orders", data)
+
+    async def place_orders_batch(
+        self, orders: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        여러 주문 동시 전송
+
+        N개 주문을 asyncio.gather로 병렬 전송하여 전체 소요 시간이
+        N·RTT 대신 max(RTT, 서버 처리시간) 수준이 되도록 합니다.
+        동시 실행은 세마포어로 10개로 제한해 레이트리밋을 지킵니다.
+
+        개별 주문의 실패(검증 ValueError 포함)는 해당 위치의
+        {'error': ...}로 돌아오고 나머지 주문 결과는 유지됩니다 -
+        일부 주문은 이미 거래소에 올라간 뒤일 수 있으므로 예외로
+        전체 결과(uuid 목록)를 잃지 않습니다.
+
+        Args:
+            orders: _send_order 인자 dict 리스트
+                (예: [{'market': 'KRW-BTC', 'side': 'bid',
+                       'volume': 0.001, 'price': 50000000}])
+
+        Returns:
+            List[Dict[str, Any]]: 입력 순서와 같은 주문 결과 리스트
+        """
+        results = await asyncio.gather(
+            *[self._send_order(**order) for order in orders],
+            return_exceptions=True,
+        )
+        return [
+            {"error": str(r)} if isinstance(r, BaseException) else r
+            for r in results
+        ]
+
+
+class AsyncMarketData:
+    """시장 데이터 비동기 조회 클래스"""
+
+    __slots__ = ("_client",)
+
+    def __init__(self) -> None:
+        """시장 데이터 비동기 조회 클래스 초기화 (인증 불필요)"""
+        self._client = _create_client()
+
+    async def get_market_codes(self) -> str:
+        """
+        빗썸 거래 가능한 코인 목록 조회
+
+        Returns:
+            str: 마켓 코드 정보 JSON 문자열
+        """
+        url = f"{_API_URL}/v1/market/all?isDetails=false"
+        headers = {"accept": "application/json"}
+        response = await self._client.get(url, headers=headers)
+        return response.text
+
+    async def get_current_price(self, coin: str) -> float:
+        """
+        특정 코인의 현재가 조회
+
+        Args:
+            coin: 마켓 코드 (예: 'KRW-BTC', 'KRW-ETH')
+
+        Returns:
+            float: 현재가
+        """
+        url = f"{_API_URL}/v1/ticker?markets={coin.upper()}"
+        headers = {"accept": "application/json"}
+        response = await self._client.get(url, headers=headers)
+        data = _loads(response.content)
+        return data[0]["trade_price"]
+
+    async def bulk_current_price(self, coins: List[str]) -> Dict[str, float]:
+        """
+        여러 코인의 현재가 동시 조회
+
+        N개 코인을 asyncio.gather로 병렬 조회하여
+        전체 소요 시간이 왕복 1회 수준이 되도록 합니다.
+
+        Args:
+            coins: 마켓 코드 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+
+        Returns:
+            Dict[str, float]: 마켓 코드별 현재가
+        """
+        prices = await asyncio.gather(
+            *[self.get_current_price(coin) for coin in coins]
+        )
+        return dict(zip(coins, prices))
+
+    async def aclose(self) -> None:
+        """클라이언트 종료 (보유 중인 커넥션 반환)"""
+        await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncMarketData":
+        return self
+
+    async def __aexit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        await self.aclose()
@@ -2,18 +2,107 @@
 Bithumb API 클라이언트 클래스
 """
 
-import hashlib
+import hmac
+import secrets
+import socket
 import time
-import uuid
+from base64 import urlsafe_b64encode
+from hashlib import sha256, sha512
 from urllib.parse import urlencode
 from typing import Optional, Dict, Any
-import jwt
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# orjson은 stdlib json보다 2~5배 빠르게 bytes를 직접 파싱 (미설치 시 stdlib 대체)
+try:
+    import orjson
+
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:  # pragma: no cover
+    import json
+
+    def _loads(data: bytes) -> Any:
+        return json.loads(data.decode())
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj).encode()
+
+
+# (connect, read) 타임아웃 - 커넥션 지연으로 틱이 멈추는 것을 방지
+_TIMEOUT = (3.05, 10)
+
+# HS256 JWT 헤더는 고정이므로 base64url 인코딩까지 미리 끝내 둠
+_JWT_HEADER = urlsafe_b64encode(b'{"alg":"HS256","typ":"JWT"}').rstrip(b"=")
+
+
+def _encode_jwt(hmac_ctx: "hmac.HMAC", payload: Dict[str, Any]) -> str:
+    """미리 키 스케줄을 마친 HMAC 컨텍스트로 HS256 JWT 생성
+
+    hmac_ctx.copy()는 비밀키의 inner/outer pad SHA 상태를 재사용하므로
+    호출마다 키 스케줄을 다시 돌리지 않습니다. 결과 토큰은 PyJWT의
+    jwt.encode(payload, secret, algorithm="HS256")와 동일하게 검증됩니다.
+    """
+    signing_input = (
+        _JWT_HEADER + b"." + urlsafe_b64encode(_dumps(payload)).rstrip(b"=")
+    )
+    ctx = hmac_ctx.copy()
+    ctx.update(signing_input)
+    signature = urlsafe_b64encode(ctx.digest()).rstrip(b"=")
+    return (signing_input + b"." + signature).decode()
+
+# brotli가 설치된 경우에만 br을 협상 - 없는데 광고하면 응답을 못 풉니다
+try:
+    import brotli  # noqa: F401
+
+    _ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:  # pragma: no cover
+    _ACCEPT_ENCODING = "gzip, deflate"
+
+
+class _LowLatencyAdapter(HTTPAdapter):
+    """소켓 지연을 줄인 HTTPAdapter
+
+    TCP_NODELAY로 작은 주문 POST가 Nagle 지연(최악 ~40ms)에 걸리지
+    않게 하고, SO_KEEPALIVE로 오래 유지되는 커넥션이 끊기지 않게 합니다.
+    """
+
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = [
+            (socket.IPPROTO_TCP, socket.TCP_NODELAY, 1),
+            (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1),
+        ]
+        return super().init_poolmanager(*args, **kwargs)
+
+
+def _build_adapter() -> HTTPAdapter:
+    """커넥션 풀 + 재시도 정책이 적용된 HTTPAdapter 생성
+
+    일시적인 429/5xx에 지수 백오프로 재시도하며, 서버가 Retry-After
+    헤더를 주면 그 시각을 따릅니다. 한 번의 502로 틱 전체가
+    실패하지 않도록 하기 위한 정책입니다.
+    """
+    retry = Retry(
+        total=3,
+        connect=2,
+        read=2,
+        status=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=frozenset(["GET", "POST", "DELETE"]),
+        respect_retry_after_header=True,
+    )
+    return _LowLatencyAdapter(
+        pool_connections=10, pool_maxsize=50, max_retries=retry
+    )
 
 
 class BithumbClient:
     """빗썸 API 클라이언트"""
 
+    __slots__ = ("access_key", "secret_key", "api_url", "_secret", "_hmac", "_session")
+
     def __init__(self, access_key: str, secret_key: str):
         """
         빗썸 API 클라이언트 초기화
@@ -26,30 +115,49 @@ class BithumbClient:
         self.secret_key = secret_key
         self.api_url = "https://api.bithumb.com"
 
+        # 서명 키를 미리 bytes로 변환하고 HMAC 키 스케줄도 1회만 수행
+        self._secret = (
+            secret_key.encode() if isinstance(secret_key, str) else secret_key
+        )
+        self._hmac = hmac.new(self._secret, digestmod=sha256)
+
+        # keep-alive 세션: 요청마다 TCP+TLS 핸드셰이크를 반복하지 않도록 재사용
+        self._session = requests.Session()
+        self._session.mount("https://", _build_adapter())
+        # 주문 목록처럼 반복 필드가 많은 JSON은 압축 전송 효과가 큼
+        self._session.headers["Accept-Encoding"] = _ACCEPT_ENCODING
+
+    def close(self) -> None:
+        """세션 종료 (보유 중인 커넥션 반환)"""
+        self._session.close()
+
+    def __enter__(self) -> "BithumbClient":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
+
+    @staticmethod
+    def _sign(query_bytes: bytes) -> str:
+        """쿼리 바이트의 SHA-512 해시 생성"""
+        return sha512(query_bytes).hexdigest()
+
     def _create_headers(
         self, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, str]:
         """JWT 인증 헤더 생성"""
         payload = {
             "access_key": self.access_key,
-            "nonce": str(uuid.uuid4()),
+            # 서버는 nonce를 불투명 문자열로만 취급 - UUID 객체 생성보다 저렴
+            "nonce": secrets.token_hex(16),
             "timestamp": round(time.time() * 1000),
         }
 
         if params:
-            query = urlencode(params).encode()
-            hash_obj = hashlib.sha512()
-            hash_obj.update(query)
-            query_hash = hash_obj.hexdigest()
-
-            payload.update(
-                {
-                    "query_hash": query_hash,
-                    "query_hash_alg": "SHA512",
-                }
-            )
+            payload["query_hash"] = self._sign(urlencode(params).encode())
+            payload["query_hash_alg"] = "SHA512"
 
-        jwt_token = jwt.encode(payload, self.secret_key)
+        jwt_token = _encode_jwt(self._hmac, payload)
         return {"Authorization": f"Bearer {jwt_token}"}
 
     def get(
@@ -58,11 +166,12 @@ class BithumbClient:
         """GET 요청"""
         headers = self._create_headers(params)
         try:
-            response = requests.get(
-                self.api_url + endpoint, params=params, headers=headers
+            response = self._session.get(
+                self.api_url + endpoint, params=params, headers=headers,
+                timeout=_TIMEOUT,
             )
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
         except requests.exceptions.RequestException as e:
             return {"error": str(e)}
 
@@ -71,25 +180,57 @@ class BithumbClient:
     ) -> Dict[str, Any]:
         """POST 요청"""
         headers = self._create_headers(data)
+        # 본문을 orjson으로 미리 직렬화 - requests 내부의 stdlib json.dumps 생략
+        body = None
+        if data is not None:
+            body = _dumps(data)
+            headers["Content-Type"] = "application/json"
         try:
-            response = requests.post(
-                self.api_url + endpoint, json=data, headers=headers
+            response = self._session.post(
+                self.api_url + endpoint, data=body, headers=headers,
+                timeout=_TIMEOUT,
             )
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
         except requests.exceptions.RequestException as e:
             return {"error": str(e)}
 
+    def get_stream(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> requests.Response:
+        """스트리밍 GET 요청
+
+        응답 전체를 메모리에 올리지 않고 점진적으로 읽을 수 있도록
+        raw 응답 객체를 반환합니다. 호출자가 close를 책임집니다.
+
+        Args:
+            endpoint: API 엔드포인트
+            params: 쿼리 파라미터
+
+        Returns:
+            requests.Response: stream=True로 열린 응답
+        """
+        headers = self._create_headers(params)
+        response = self._session.get(
+            self.api_url + endpoint, params=params, headers=headers,
+            stream=True, timeout=_TIMEOUT,
+        )
+        response.raise_for_status()
+        # gzip 등으로 압축된 본문도 raw에서 바로 읽히도록
+        response.raw.decode_content = True
+        return response
+
     def delete(
         self, endpoint: str, params: Optional[Dict[str, Any]] = None
     ) -> Dict[str, Any]:
         """DELETE 요청"""
         headers = self._create_headers(params)
         try:
-            response = requests.delete(
-                self.api_url + endpoint, params=params, headers=headers
+            response = self._session.delete(
+                self.api_url + endpoint, params=params, headers=headers,
+                timeout=_TIMEOUT,
             )
             response.raise_for_status()
-            return response.json()
+            return _loads(response.content)
         except requests.exceptions.RequestException as e:
             return {"error": str(e)}
@@ -2,48 +2,120 @@
 시장 데이터 조회 모듈
 """
 
-import json
-from typing import List, Dict, Any
-import pandas as pd
+from typing import TYPE_CHECKING, List, Dict, Any
 import requests
+from cachetools import TTLCache, cached
+from .client import _ACCEPT_ENCODING, _TIMEOUT, _build_adapter, _loads
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+
+# 모듈 전역 keep-alive 세션 - 정적 메서드들이 커넥션을 공유
+_SESSION = requests.Session()
+_SESSION.mount("https://", _build_adapter())
+_SESSION.headers["Accept-Encoding"] = _ACCEPT_ENCODING
+
+# 마켓 목록은 하루에 한 번 정도 바뀌고, 현재가는 한 틱 내 중복 조회가 잦음
+_MARKETS_CACHE = TTLCache(maxsize=1, ttl=3600)
+_PRICE_CACHE = TTLCache(maxsize=256, ttl=0.5)
+
+# 호출마다 재조립하지 않도록 URL/헤더를 모듈 상수로 유지
+_HDRS = {"accept": "application/json"}
+_MARKETS_URL = "https://api.bithumb.com/v1/market/all?isDetails=false"
+_TICKER_URL = "https://api.bithumb.com/v1/ticker"
+_MINUTES_URL = "https://api.bithumb.com/v1/candles/minutes/{unit}"
+_DAILY_URL = "https://api.bithumb.com/v1/candles/days"
+_WEEKLY_URL = "https://api.bithumb.com/v1/candles/weeks"
+_MONTHLY_URL = "https://api.bithumb.com/v1/candles/months"
+
+# 캔들 응답 컬럼명 매핑과 출력 컬럼 순서
+_RENAME = {
+    "candle_date_time_kst": "date",
+    "opening_price": "open",
+    "trade_price": "close",
+    "high_price": "high",
+    "low_price": "low",
+    "candle_acc_trade_volume": "volume",
+    "candle_acc_trade_price": "value",
+    "change_rate": "change_rate",
+}
+_COLS = ["date", "open", "close", "high", "low", "change_rate", "volume", "value"]
+
+
+def _normalize_market(coin: str) -> str:
+    """'btc'/'BTC' 같은 심볼을 'KRW-BTC' 마켓 코드로 정규화
+
+    이미 'KRW-BTC' 형태면 대문자화만 합니다. 심볼만 넘겨도
+    잘못된 마켓 코드로 API를 때려 404 왕복을 낭비하지 않도록 합니다.
+    """
+    market = coin.upper()
+    if "-" not in market:
+        market = f"KRW-{market}"
+    return market
 
 
 class MarketData:
     """시장 데이터 조회 클래스"""
 
+    # 모든 메서드가 정적이라 인스턴스 속성이 없음
+    __slots__ = ()
+
     @staticmethod
-    def get_market_codes() -> str:
+    @cached(_MARKETS_CACHE)
+    def get_market_codes() -> List[Dict[str, Any]]:
         """
         빗썸 거래 가능한 코인 목록 조회
 
+        목록은 거의 변하지 않으므로 1시간 동안 캐시됩니다.
+
+        Returns:
+            List[Dict[str, Any]]: 마켓 코드 정보 리스트
+        """
+        response = _SESSION.get(_MARKETS_URL, headers=_HDRS, timeout=_TIMEOUT)
+        # 에러 응답이 1시간짜리 캐시에 박히지 않도록 - 예외는 캐시되지 않음
+        response.raise_for_status()
+        return _loads(response.content)
+
+    @staticmethod
+    def get_market_codes_raw() -> str:
+        """
+        빗썸 거래 가능한 코인 목록을 JSON 문자열로 조회
+
+        파싱 전 원문이 필요한 기존 호출자를 위한 메서드입니다.
+
         Returns:
             str: 마켓 코드 정보 JSON 문자열
         """
-        url = "https://api.bithumb.com/v1/market/all?isDetails=false"
-        headers = {"accept": "application/json"}
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(_MARKETS_URL, headers=_HDRS, timeout=_TIMEOUT)
         return response.text
 
     @staticmethod
+    @cached(_PRICE_CACHE)
     def get_current_price(coin: str) -> float:
         """
         특정 코인의 현재가 조회
 
+        같은 코인을 0.5초 안에 재조회하면 캐시된 값을 반환하여
+        전략 코드의 반복 호출이 네트워크 왕복을 만들지 않습니다.
+
         Args:
             coin: 마켓 코드 (예: 'KRW-BTC', 'KRW-ETH')
 
         Returns:
             float: 현재가
         """
-        url = f"https://api.bithumb.com/v1/ticker?markets={coin.upper()}"
-        headers = {"accept": "application/json"}
-
-        response = requests.get(url, headers=headers)
-        data = json.loads(response.text)
+        response = _SESSION.get(
+            _TICKER_URL,
+            params={"markets": _normalize_market(coin)},
+            headers=_HDRS,
+            timeout=_TIMEOUT,
+        )
+        data = _loads(response.content)
         return data[0]["trade_price"]
 
     @staticmethod
-    def _get_candle_data(url: str, coin: str, count: int = 30) -> pd.DataFrame:
+    def _get_candle_data(url: str, coin: str, count: int = 30) -> "pd.DataFrame":
         """
         캔들 데이터 조회 공통 함수
 
@@ -55,11 +127,14 @@ class MarketData:
         Returns:
             pd.DataFrame: 캔들 데이터
         """
-        params = {"market": f"{coin.upper()}", "count": count}
-        headers = {"accept": "application/json"}
-        resp = requests.get(url, headers=headers, params=params)
+        # pandas는 캔들 경로에서만 필요 - 시세/주문만 쓰는 프로세스의
+        # 콜드 스타트(~0.5초)에 부담을 주지 않도록 지연 임포트
+        import pandas as pd
+
+        params = {"market": _normalize_market(coin), "count": count}
+        resp = _SESSION.get(url, headers=_HDRS, params=params, timeout=_TIMEOUT)
         resp.raise_for_status()
-        data = resp.json()
+        data = _loads(resp.content)
 
         # 정상 응답은 리스트, 에러 응답은 dict
         if isinstance(data, dict) and "status" in data and data["status"] != "0000":
@@ -67,32 +142,17 @@ class MarketData:
         if not isinstance(data, list):
             raise Exception(f"API 응답이 리스트가 아님: {data}")
 
-        df = pd.DataFrame(data)
-        df = df.rename(
-            columns={
-                "candle_date_time_kst": "date",
-                "opening_price": "open",
-                "trade_price": "close",
-                "high_price": "high",
-                "low_price": "low",
-                "candle_acc_trade_volume": "volume",
-                "candle_acc_trade_price": "value",
-                "change_rate": "change_rate",
-            }
-        )
-
-        # 선택할 컬럼 리스트 (존재하는 것만)
-        base_columns = ["date", "open", "close", "high", "low"]
-        optional_columns = ["change_rate", "volume", "value"]
-        columns = base_columns + [c for c in optional_columns if c in df.columns]
-
-        df = df[columns]
-        df["date"] = pd.to_datetime(df["date"])
-        df = df.sort_values("date").reset_index(drop=True)
+        # API는 최신순으로 내려주므로 리스트 뒤집기로 정렬을 대체 (sort_values 불필요)
+        data.reverse()
+        df = pd.DataFrame.from_records(data)
+        df.rename(columns=_RENAME, inplace=True)
+        df = df[[c for c in _COLS if c in df.columns]]
+        # format 지정 시 포맷 추론 없이 파싱되어 훨씬 빠름
+        df["date"] = pd.to_datetime(df["date"], format="%Y-%m-%dT%H:%M:%S", cache=True)
         return df
 
     @staticmethod
-    def get_minutes_data(coin: str, unit: int = 1, count: int = 30) -> pd.DataFrame:
+    def get_minutes_data(coin: str, unit: int = 1, count: int = 30) -> "pd.DataFrame":
         """
         분봉 데이터 조회
 
@@ -104,11 +164,10 @@ class MarketData:
         Returns:
             pd.DataFrame: 분봉 데이터
         """
-        url = f"https://api.bithumb.com/v1/candles/minutes/{unit}"
-        return MarketData._get_candle_data(url, coin, count)
+        return MarketData._get_candle_data(_MINUTES_URL.format(unit=unit), coin, count)
 
     @staticmethod
-    def get_daily_data(coin: str, count: int = 30) -> pd.DataFrame:
+    def get_daily_data(coin: str, count: int = 30) -> "pd.DataFrame":
         """
         일봉 데이터 조회
 
@@ -119,11 +178,10 @@ class MarketData:
         Returns:
             pd.DataFrame: 일봉 데이터
         """
-        url = "https://api.bithumb.com/v1/candles/days"
-        return MarketData._get_candle_data(url, coin, count)
+        return MarketData._get_candle_data(_DAILY_URL, coin, count)
 
     @staticmethod
-    def get_weekly_data(coin: str, count: int = 30) -> pd.DataFrame:
+    def get_weekly_data(coin: str, count: int = 30) -> "pd.DataFrame":
         """
         주봉 데이터 조회
 
@@ -134,11 +192,10 @@ class MarketData:
         Returns:
             pd.DataFrame: 주봉 데이터
         """
-        url = "https://api.bithumb.com/v1/candles/weeks"
-        return MarketData._get_candle_data(url, coin, count)
+        return MarketData._get_candle_data(_WEEKLY_URL, coin, count)
 
     @staticmethod
-    def get_monthly_data(coin: str, count: int = 30) -> pd.DataFrame:
+    def get_monthly_data(coin: str, count: int = 30) -> "pd.DataFrame":
         """
         월봉 데이터 조회
 
@@ -149,5 +206,4 @@ class MarketData:
         Returns:
             pd.DataFrame: 월봉 데이터
         """
-        url = "https://api.bithumb.com/v1/candles/months"
-        return MarketData._get_candle_data(url, coin, count)
+        return MarketData._get_candle_data(_MONTHLY_URL, coin, count)
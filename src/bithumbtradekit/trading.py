@@ -3,31 +3,167 @@
 """
 
 import logging
-from typing import Dict, Any, Optional
-from .client import BithumbClient
+import re
+import sys
+import threading
+from decimal import Decimal
+from functools import lru_cache
+from typing import Dict, Any, Iterator, List, Optional, Protocol, Sequence, Union
+from cachetools import TTLCache
 
 
 logger = logging.getLogger(__name__)
 
+# 수량/가격 입력 타입. float 반올림 오차('0.10000000000000001')로 주문이
+# 거부되지 않도록 Decimal("0.1")이나 문자열 사용을 권장합니다.
+Numeric = Union[float, Decimal, str]
+
+
+class OrderTransport(Protocol):
+    """Trading이 요구하는 최소 클라이언트 인터페이스
+
+    BithumbClient가 기본 구현이며, 동일한 시그니처를 제공하는
+    다른 전송 계층(테스트 더블, 향후 추가될 전송 방식)도
+    그대로 주입할 수 있습니다.
+    """
+
+    def get(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]: ...
+
+    def post(
+        self, endpoint: str, data: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]: ...
+
+    def delete(
+        self, endpoint: str, params: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]: ...
+
+# 주문 상태 문자열 인터닝 테이블 - 폴링 루프의 state == "wait" 비교가
+# 포인터 동일성 검사로 끝나도록 항상 같은 객체를 반환
+_STATES = {
+    s: sys.intern(s)
+    for s in ("wait", "watch", "done", "cancel", "error", "unknown")
+}
+
+# 서버까지 갔다가 거부당할 주문을 로컬에서 걸러내기 위한 검증 상수.
+# 잘못된 파라미터 하나가 왕복 1회와 레이트리밋 예산을 낭비합니다.
+_VALID_SIDES = frozenset(("bid", "ask"))
+_VALID_ORD_TYPES = frozenset(("limit", "market", "price"))
+_MARKET_RE = re.compile(r"^[A-Z]{3,5}-[A-Z0-9]{2,10}$")
+
+
+def _validate_order(market: str, side: str, ord_type: str) -> None:
+    """주문 파라미터 사전 검증 (잘못되면 ValueError)"""
+    if side not in _VALID_SIDES:
+        raise ValueError(f"잘못된 side: {side!r} ('bid' 또는 'ask')")
+    if ord_type not in _VALID_ORD_TYPES:
+        raise ValueError(
+            f"잘못된 ord_type: {ord_type!r} ('limit', 'market', 'price')"
+        )
+    if not _MARKET_RE.match(market):
+        raise ValueError(f"잘못된 마켓 코드: {market!r} (예: 'KRW-BTC')")
+
+
+# (side, ord_type) 조합별 주문 dict 템플릿 - 호출마다 키를 새로 쌓지 않고 copy만
+_TEMPLATES = {
+    (side, otype): {"side": side, "ord_type": otype}
+    for side in ("bid", "ask")
+    for otype in ("limit", "market", "price")
+}
+
+
+# 같은 UUID/마켓으로 반복 폴링할 때 params dict를 매번 새로 만들지 않도록 캐시.
+# 반환된 dict는 읽기 전용으로만 사용해야 합니다 (호출자 간 공유됨).
+@lru_cache(maxsize=1024)
+def _uuid_params(order_uuid: str) -> Dict[str, str]:
+    return {"uuid": order_uuid}
+
+
+@lru_cache(maxsize=64)
+def _market_params(market: str) -> Dict[str, str]:
+    return {"market": market}
+
+
+@lru_cache(maxsize=256)
+def _orders_params(market: Optional[str], state: str) -> Dict[str, str]:
+    if market:
+        return {"market": market, "state": state}
+    return {"state": state}
+
+
+# typed=True 필수: Decimal(0.1)과 0.1은 해시가 같아 타입 무시 시
+# 서로의 캐시 엔트리를 오염시킵니다
+@lru_cache(maxsize=1024, typed=True)
+def _fmt(value: Numeric) -> str:
+    """수량/가격을 지수 표기 없는 10진 문자열로 변환
+
+    문자열은 그대로 통과시키고 float/Decimal은 고정소수점으로
+    포맷합니다. 그리드 봇처럼 같은 수량이 반복되는 경우를 위해
+    결과를 캐시합니다.
+    """
+    if isinstance(value, str):
+        return value
+    if isinstance(value, float):
+        # format(float, "f")는 기본 소수 6자리로 반올림해 수량을 바꿉니다
+        # (1e-07 -> '0'). repr 경유 Decimal로 자릿수 손실 없이 변환합니다.
+        value = Decimal(repr(value))
+    text = format(value, "f")
+    # 정수 Decimal은 포맷 결과에 소수점이 없음 - 무조건 strip하면 '100' -> '1'
+    if "." in text:
+        text = text.rstrip("0").rstrip(".")
+    return text
+
 
 class Trading:
     """거래 관리 클래스"""
 
-    def __init__(self, client: BithumbClient):
+    __slots__ = ("client", "_lock", "_chance_cache", "_status_cache")
+
+    def __init__(self, client: OrderTransport):
         """
         거래 관리 클래스 초기화
 
         Args:
-            client: BithumbClient 인스턴스
+            client: BithumbClient 등 OrderTransport를 만족하는 클라이언트
         """
         self.client = client
+        # 주문 직전마다 반복 조회되는 엔드포인트용 초단기 캐시
+        self._lock = threading.Lock()
+        self._chance_cache = TTLCache(maxsize=64, ttl=0.25)
+        self._status_cache = TTLCache(maxsize=256, ttl=0.1)
+
+    def cache_clear(self) -> None:
+        """주문 가능 정보/주문 상태 캐시 비우기
+
+        주문을 넣거나 취소한 직후 최신 상태가 필요하면 호출하세요.
+        """
+        with self._lock:
+            self._chance_cache.clear()
+            self._status_cache.clear()
+
+    def close(self) -> None:
+        """주입된 클라이언트의 커넥션 반환 (close를 제공하는 경우)
+
+        클라이언트를 Account 등과 공유 중이라면 마지막 사용처에서만
+        호출해야 합니다.
+        """
+        close = getattr(self.client, "close", None)
+        if close is not None:
+            close()
+
+    def __enter__(self) -> "Trading":
+        return self
+
+    def __exit__(self, exc_type: Any, exc_val: Any, exc_tb: Any) -> None:
+        self.close()
 
     def _send_order(
         self,
         market: str,
         side: str,
-        volume: Optional[float] = None,
-        price: Optional[float] = None,
+        volume: Optional[Numeric] = None,
+        price: Optional[Numeric] = None,
         ord_type: str = "limit",
     ) -> Dict[str, Any]:
         """
@@ -42,35 +178,40 @@ class Trading:
 
         Returns:
             Dict[str, Any]: 주문 결과
+
+        Raises:
+            ValueError: side/ord_type/market이 유효하지 않은 경우
         """
-        data = {
-            "market": market,
-            "side": side,
-            "ord_type": ord_type,
-        }
+        _validate_order(market, side, ord_type)
+        data = _TEMPLATES[(side, ord_type)].copy()
+        data["market"] = market
 
         # 지정가 주문: volume + price 필요
         if ord_type == "limit":
             if volume is not None:
-                data["volume"] = str(volume)
+                data["volume"] = _fmt(volume)
             if price is not None:
-                data["price"] = str(price)
+                data["price"] = _fmt(price)
         # 시장가 매수 (price 타입): price(총 주문 금액) 필요
         elif ord_type == "price":
             if price is not None:
-                data["price"] = str(price)
+                data["price"] = _fmt(price)
         # 시장가 매도 (market 타입): volume 필요
         elif ord_type == "market":
             if volume is not None:
-                data["volume"] = str(volume)
+                data["volume"] = _fmt(volume)
+
+        # isEnabledFor 가드로 DEBUG 비활성 시 포맷 비용 자체를 회피
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"📤 주문 전송: {data}")
 
         return self.client.post("/v1/orders", data)
 
     def place_buy_order(
         self,
         market: str,
-        volume: Optional[float] = None,
-        price: Optional[float] = None,
+        volume: Optional[Numeric] = None,
+        price: Optional[Numeric] = None,
         ord_type: str = "limit",
     ) -> Dict[str, Any]:
         """
@@ -94,8 +235,8 @@ class Trading:
     def place_sell_order(
         self,
         market: str,
-        volume: float,
-        price: Optional[float] = None,
+        volume: Numeric,
+        price: Optional[Numeric] = None,
         ord_type: str = "limit",
     ) -> Dict[str, Any]:
         """
@@ -122,8 +263,25 @@ class Trading:
         Returns:
             Dict[str, Any]: 취소 결과
         """
-        params = {"uuid": order_uuid}
-        return self.client.delete("/v1/order", params)
+        return self.client.delete("/v1/order", _uuid_params(order_uuid))
+
+    def cancel_orders(self, uuids: Sequence[str]) -> List[Dict[str, Any]]:
+        """
+        여러 주문 일괄 취소
+
+        빗썸 REST에는 일괄 취소 엔드포인트가 없어 주문별 DELETE를
+        보내지만, keep-alive 세션의 커넥션을 재사용하므로 취소 폭주
+        시에도 TLS 수립 비용은 1회로 끝납니다. 개별 실패는 해당
+        위치의 {'error': ...}로 돌아오고 나머지 취소는 계속됩니다.
+
+        Args:
+            uuids: 취소할 주문 UUID 목록
+
+        Returns:
+            List[Dict[str, Any]]: 입력 순서와 같은 취소 결과 리스트
+        """
+        delete = self.client.delete
+        return [delete("/v1/order", _uuid_params(u)) for u in uuids]
 
     def get_order_status(self, order_uuid: str) -> str:
         """
@@ -133,15 +291,29 @@ class Trading:
             order_uuid: 주문 UUID
 
         Returns:
-            str: 주문 상태 ("wait", "done", "cancel", "error", "unknown")
+            str: 주문 상태 ("wait", "watch", "done", "cancel" 등 서버가
+            준 상태 그대로. 조회 실패 시 "error", 상태 누락 시 "unknown")
         """
-        params = {"uuid": order_uuid}
-        result = self.client.get("/v1/order", params)
-
-        if "error" in result:
-            return "error"
-
-        return result.get("state", "unknown")
+        with self._lock:
+            cached = self._status_cache.get(order_uuid)
+        if cached is not None:
+            return cached
+
+        result = self.client.get("/v1/order", _uuid_params(order_uuid))
+
+        # 압도적으로 흔한 성공 경로를 먼저 확인 - 에러 키 탐사는 실패시에만
+        state = result.get("state")
+        if state:
+            # 테이블 밖의 신규 상태는 원문 그대로 반환 (인터닝만 적용)
+            state = _STATES.get(state) or sys.intern(state)
+            # 종결 상태(done/cancel)는 캐시하지 않아도 다시 바뀌지 않고,
+            # 에러/unknown은 재시도가 맞으므로 wait만 잠깐 캐시
+            if state is _STATES["wait"]:
+                with self._lock:
+                    self._status_cache[order_uuid] = state
+            return state
+
+        return _STATES["error"] if "error" in result else _STATES["unknown"]
 
     def get_orders(
         self, market: Optional[str] = None, state: str = "wait"
@@ -156,11 +328,54 @@ class Trading:
         Returns:
             Dict[str, Any]: 주문 목록
         """
-        params = {"state": state}
-        if market:
-            params["market"] = market
+        return self.client.get("/v1/orders", _orders_params(market, state))
+
+    def iter_orders(
+        self, market: Optional[str] = None, state: str = "wait"
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        주문 목록 스트리밍 조회
 
-        return self.client.get("/v1/orders", params)
+        응답을 통째로 파싱하는 get_orders와 달리 레코드 단위로
+        yield하므로, state='done' 같은 대용량 조회에서도 메모리
+        사용이 주문 1건 수준으로 유지되고 첫 주문이 바로 나옵니다.
+        ijson 미설치 시, 또는 주입된 클라이언트가 get_stream을
+        제공하지 않으면(OrderTransport 최소 구현) get_orders로
+        대체 동작합니다 (``pip install bithumbtradekit[stream]``).
+
+        Args:
+            market: 마켓 코드 (전체 조회시 None)
+            state: 주문 상태 ("wait", "done", "cancel")
+
+        Yields:
+            Dict[str, Any]: 주문 정보
+
+        Note:
+            {'error': ...} 반환 대신 예외를 전파합니다. 이미 일부를
+            yield한 뒤 실패할 수 있어 에러를 반환값으로 접을 수 없기
+            때문입니다 (스트리밍 경로는 requests 예외, get_orders
+            대체 경로는 RuntimeError).
+        """
+        try:
+            import ijson
+        except ImportError:
+            ijson = None
+
+        get_stream = getattr(self.client, "get_stream", None)
+        if ijson is None or get_stream is None:
+            result = self.get_orders(market, state)
+            if isinstance(result, dict) and "error" in result:
+                # 조회 실패를 빈 목록처럼 보이게 하지 않음
+                raise RuntimeError(result["error"])
+            if isinstance(result, list):
+                yield from result
+            return
+
+        response = get_stream("/v1/orders", _orders_params(market, state))
+        try:
+            yield from ijson.items(response.raw, "item")
+        finally:
+            response.close()
 
     def get_order_chance(self, market: str) -> Dict[str, Any]:
         """
@@ -172,5 +387,13 @@ class Trading:
         Returns:
             Dict[str, Any]: 주문 가능 정보
         """
-        params = {"market": market}
-        return self.client.get("/v1/orders/chance", params)
+        with self._lock:
+            cached = self._chance_cache.get(market)
+        if cached is not None:
+            return cached
+
+        result = self.client.get("/v1/orders/chance", _market_params(market))
+        if "error" not in result:
+            with self._lock:
+                self._chance_cache[market] = result
+        return result
@@ -0,0 +1,43 @@
+"""trading 모듈 테스트"""
+
+from decimal import Decimal
+
+from bithumbtradekit.trading import _fmt
+
+
+def test_fmt_integral_decimal():
+    # 소수점 없는 포맷 결과를 strip해 '50000000' -> '5'가 되던 회귀 방지
+    assert _fmt(Decimal("50000000")) == "50000000"
+    assert _fmt(Decimal("100")) == "100"
+
+
+def test_fmt_fractional_decimal():
+    assert _fmt(Decimal("0.1000")) == "0.1"
+    assert _fmt(Decimal("0")) == "0"
+    assert _fmt(Decimal("0.0")) == "0"
+
+
+def test_fmt_integral_float():
+    assert _fmt(100.0) == "100"
+
+
+def test_fmt_small_float_exact():
+    # float이 기본 소수 6자리로 반올림되던 회귀 방지
+    assert _fmt(0.00012345) == "0.00012345"
+    assert _fmt(1e-07) == "0.0000001"
+    assert _fmt(0.1) == "0.1"
+
+
+def test_fmt_str_passthrough():
+    assert _fmt("0.00012345") == "0.00012345"
+
+
+def test_fmt_cache_keys_are_typed():
+    # Decimal(0.1)과 0.1은 해시가 같음 - 캐시가 타입을 무시하면
+    # float 호출이 Decimal의 55자리 정확 전개 문자열을 돌려받음
+    _fmt.cache_clear()
+    assert _fmt(Decimal(0.1)) != "0.1"
+    assert _fmt(0.1) == "0.1"
+    _fmt.cache_clear()
+    assert _fmt(0.1) == "0.1"
+    assert _fmt(Decimal(0.1)) != "0.1"